@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import codecs
+import encodings
 import unittest
 from typing import Any
+from unittest import mock
 
 from w3lib.encoding import (
+    DEFAULT_ENCODING_TRANSLATION,
+    _c18n_encoding,
     html_body_declared_encoding,
     html_to_unicode,
     http_content_type_encoding,
@@ -115,6 +119,32 @@ class CodecsEncodingTestCase(unittest.TestCase):
         self.assertEqual(resolve_encoding("gb_2312-80"), "gb18030")
         self.assertEqual(resolve_encoding("unknown encoding"), None)
 
+    def test_resolve_encoding_translation_changes(self):
+        self.assertEqual(resolve_encoding("koi8_r"), "koi8-r")
+        with mock.patch.dict(DEFAULT_ENCODING_TRANSLATION, {"koi8_r": "cp1251"}):
+            self.assertEqual(resolve_encoding("koi8_r"), "cp1251")
+        self.assertEqual(resolve_encoding("koi8_r"), "koi8-r")
+
+    def test_c18n_encoding(self):
+        for encoding in (
+            "",
+            "UTF-8",
+            " Latin-1",
+            "gb_2312-80",
+            "__x-mac--roman__",
+            "iso.8859.1",
+            "_._",
+            "utf\t8;",
+            "lat\xedn-1",
+            "-\xe9-utf8",
+        ):
+            normed = encodings.normalize_encoding(encoding).lower()
+            self.assertEqual(
+                _c18n_encoding(encoding),
+                encodings.aliases.aliases.get(normed, normed),
+                encoding,
+            )
+
 
 class UnicodeDecodingTestCase(unittest.TestCase):
     def test_utf8(self):
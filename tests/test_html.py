@@ -48,6 +48,16 @@ class RemoveEntitiesTest(unittest.TestCase):
             ),
             "<b>Low &lt; High &amp; Medium \xa3 six</b>",
         )
+        # keep can be any iterable, including a one-shot iterator
+        self.assertEqual(
+            replace_entities(
+                "<b>Low &lt; High &amp; Medium &pound; six</b>",
+                keep=iter(["amp", "lt"]),
+            ),
+            "<b>Low &lt; High &amp; Medium \xa3 six</b>",
+        )
+        # a single entity name can be passed as a string
+        self.assertEqual(replace_entities("&amp;&lt;&gt;", keep="amp"), "&amp;<>")
 
     def test_illegal_entities(self):
         self.assertEqual(
@@ -360,6 +370,18 @@ although this is inside a cdata! &amp; &quot;</node1><node2>blah&blahblahblahbla
             'something\xa3&more<node3>things, stuff, and suchwhat"ever</node3><node4',
         )
 
+    def test_keep(self):
+        # keep applies to the entities on both sides of a CDATA section, even
+        # when given as a one-shot iterator
+        self.assertEqual(
+            unquote_markup(self.sample_txt2, keep=iter(["amp", "lt"])),
+            "<node2>blah&amp;blahblahblahblah!&pound;moreblah&lt;></node2>",
+        )
+        self.assertEqual(
+            unquote_markup(self.sample_txt2, keep="lt"),
+            "<node2>blah&blahblahblahblah!&pound;moreblah&lt;></node2>",
+        )
+
 
 class GetBaseUrlTest(unittest.TestCase):
     def test_get_base_url(self):
@@ -5,7 +5,10 @@ import string
 # https://infra.spec.whatwg.org/commit-snapshots/59e0d16c1e3ba0e77c6a60bfc69a0929b8ffaa5d/#code-points
 _ASCII_TAB_OR_NEWLINE = "\t\n\r"
 _ASCII_WHITESPACE = "\t\n\x0c\r "
-_C0_CONTROL = "".join(chr(n) for n in range(32))
+_C0_CONTROL = (
+    "\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    "\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f"
+)
 _C0_CONTROL_OR_SPACE = _C0_CONTROL + " "
 _ASCII_DIGIT = string.digits
 _ASCII_HEX_DIGIT = string.hexdigits
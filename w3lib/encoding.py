@@ -7,6 +7,7 @@ from __future__ import annotations
 import codecs
 import encodings
 import re
+from functools import lru_cache
 from re import Match
 from typing import Callable, cast
 
@@ -129,13 +130,27 @@ DEFAULT_ENCODING_TRANSLATION = {
 }
 
 
+# ASCII equivalent of the per-character loop of encodings.normalize_encoding()
+_ENCODING_NAME_PUNCTUATION_RE = re.compile(r"[^0-9A-Za-z.]+")
+
+
+# Pages and headers keep declaring the same handful of encodings, so each
+# distinct name is only normalized once. Only this step is cached: the alias
+# and translation tables it is looked up in afterwards are mutable.
+@lru_cache(maxsize=256)
+def _normalize_encoding(encoding: str) -> str:
+    if encoding.isascii():
+        return _ENCODING_NAME_PUNCTUATION_RE.sub("_", encoding).strip("_").lower()
+    return encodings.normalize_encoding(encoding).lower()
+
+
 def _c18n_encoding(encoding: str) -> str:
     """Canonicalize an encoding name
 
     This performs normalization and translates aliases using python's
     encoding aliases
     """
-    normed = encodings.normalize_encoding(encoding).lower()
+    normed = _normalize_encoding(encoding)
     return cast(str, encodings.aliases.aliases.get(normed, normed))
 
 
@@ -74,6 +74,10 @@ def replace_entities(
 
     """
 
+    if isinstance(keep, str):
+        keep = [keep]
+    keep = frozenset(keep)
+
     def convert_entity(m: Match[str]) -> str:
         groups = m.groupdict()
         number = None
@@ -263,8 +267,9 @@ def replace_escape_chars(
     """
 
     utext = to_unicode(text, encoding)
+    ureplace_by = to_unicode(replace_by, encoding)
     for ec in which_ones:
-        utext = utext.replace(ec, to_unicode(replace_by, encoding))
+        utext = utext.replace(ec, ureplace_by)
     return utext
 
 
@@ -294,18 +299,22 @@ def unquote_markup(
             offset = match_e
         yield txt[offset:]
 
+    if isinstance(keep, str):
+        keep = [keep]
+    # keep is used for every fragment, so it must not be a one-shot iterator
+    keep = frozenset(keep)
     utext = to_unicode(text, encoding)
-    ret_text = ""
+    ret_text = []
     for fragment in _get_fragments(utext, _cdata_re):
         if isinstance(fragment, str):
             # it's not a CDATA (so we try to remove its entities)
-            ret_text += replace_entities(
-                fragment, keep=keep, remove_illegal=remove_illegal
+            ret_text.append(
+                replace_entities(fragment, keep=keep, remove_illegal=remove_illegal)
             )
         else:
             # it's a CDATA (so we just extract its content)
-            ret_text += fragment.group("cdata_d")
-    return ret_text
+            ret_text.append(fragment.group("cdata_d"))
+    return "".join(ret_text)
 
 
 def get_base_url(
@@ -74,16 +74,28 @@ _QUERY_SAFEST_CHARS = _PATH_SAFEST_CHARS
 _SPECIAL_QUERY_SAFEST_CHARS = _PATH_SAFEST_CHARS.translate(None, delete=b"'")
 _FRAGMENT_SAFEST_CHARS = _PATH_SAFEST_CHARS
 
+# quote() filters a bytes "safe" argument with a Python-level loop on every
+# call, but converts a str one in C, so it is given str copies of the sets
+# above.
+_safe_chars_str = _safe_chars.decode("ascii")
+_path_safe_chars_str = _path_safe_chars.decode("ascii")
+_USERINFO_SAFEST_CHARS_STR = _USERINFO_SAFEST_CHARS.decode("ascii")
+_PATH_SAFEST_CHARS_STR = _PATH_SAFEST_CHARS.decode("ascii")
+_QUERY_SAFEST_CHARS_STR = _QUERY_SAFEST_CHARS.decode("ascii")
+_SPECIAL_QUERY_SAFEST_CHARS_STR = _SPECIAL_QUERY_SAFEST_CHARS.decode("ascii")
+_FRAGMENT_SAFEST_CHARS_STR = _FRAGMENT_SAFEST_CHARS.decode("ascii")
 
-_ASCII_TAB_OR_NEWLINE_TRANSLATION_TABLE = {
-    ord(char): None for char in _ASCII_TAB_OR_NEWLINE
-}
+
+_ASCII_TAB_OR_NEWLINE_TRANSLATION_TABLE = str.maketrans("", "", _ASCII_TAB_OR_NEWLINE)
 
 
 def _strip(url: str) -> str:
-    return url.strip(_C0_CONTROL_OR_SPACE).translate(
-        _ASCII_TAB_OR_NEWLINE_TRANSLATION_TABLE
-    )
+    url = url.strip(_C0_CONTROL_OR_SPACE)
+    # Tabs and newlines are rare in URLs, and looking for them is much cheaper
+    # than a translate() call that would leave the URL unchanged.
+    if any(char in url for char in _ASCII_TAB_OR_NEWLINE):
+        return url.translate(_ASCII_TAB_OR_NEWLINE_TRANSLATION_TABLE)
+    return url
 
 
 def safe_url_string(  # pylint: disable=too-many-locals
@@ -144,39 +156,39 @@ def safe_url_string(  # pylint: disable=too-many-locals
         parts.hostname,
         parts.port,
     )
-    netloc_bytes = b""
+    netloc_parts: list[bytes] = []
     if username is not None or password is not None:
         if username is not None:
-            safe_username = quote(unquote(username), _USERINFO_SAFEST_CHARS)
-            netloc_bytes += safe_username.encode(encoding)
+            safe_username = quote(unquote(username), _USERINFO_SAFEST_CHARS_STR)
+            netloc_parts.append(safe_username.encode(encoding))
         if password is not None:
-            netloc_bytes += b":"
-            safe_password = quote(unquote(password), _USERINFO_SAFEST_CHARS)
-            netloc_bytes += safe_password.encode(encoding)
-        netloc_bytes += b"@"
+            netloc_parts.append(b":")
+            safe_password = quote(unquote(password), _USERINFO_SAFEST_CHARS_STR)
+            netloc_parts.append(safe_password.encode(encoding))
+        netloc_parts.append(b"@")
     if hostname is not None:
         try:
-            netloc_bytes += hostname.encode("idna")
+            netloc_parts.append(hostname.encode("idna"))
         except UnicodeError:
             # IDNA encoding can fail for too long labels (>63 characters) or
             # missing labels (e.g. http://.example.com)
-            netloc_bytes += hostname.encode(encoding)
+            netloc_parts.append(hostname.encode(encoding))
     if port is not None:
-        netloc_bytes += b":"
-        netloc_bytes += str(port).encode(encoding)
+        netloc_parts.append(b":")
+        netloc_parts.append(str(port).encode(encoding))
 
-    netloc = netloc_bytes.decode()
+    netloc = b"".join(netloc_parts).decode()
 
     # default encoding for path component SHOULD be UTF-8
     if quote_path:
-        path = quote(parts.path.encode(path_encoding), _PATH_SAFEST_CHARS)
+        path = quote(parts.path.encode(path_encoding), _PATH_SAFEST_CHARS_STR)
     else:
         path = parts.path
 
     if parts.scheme in _SPECIAL_SCHEMES:
-        query = quote(parts.query.encode(encoding), _SPECIAL_QUERY_SAFEST_CHARS)
+        query = quote(parts.query.encode(encoding), _SPECIAL_QUERY_SAFEST_CHARS_STR)
     else:
-        query = quote(parts.query.encode(encoding), _QUERY_SAFEST_CHARS)
+        query = quote(parts.query.encode(encoding), _QUERY_SAFEST_CHARS_STR)
 
     return urlunsplit(
         (
@@ -184,7 +196,7 @@ def safe_url_string(  # pylint: disable=too-many-locals
             netloc,
             path,
             query,
-            quote(parts.fragment.encode(encoding), _FRAGMENT_SAFEST_CHARS),
+            quote(parts.fragment.encode(encoding), _FRAGMENT_SAFEST_CHARS_STR),
         )
     )
 
@@ -319,6 +331,7 @@ def url_query_cleaner(
 
     if isinstance(parameterlist, (str, bytes)):
         parameterlist = [parameterlist]
+    parameters = frozenset(parameterlist)
     url, fragment = urldefrag(url)
     url = cast(str, url)
     fragment = cast(str, fragment)
@@ -331,9 +344,9 @@ def url_query_cleaner(
         k, _, _ = ksv.partition(kvsep)
         if unique and k in seen:
             continue
-        if remove and k in parameterlist:
+        if remove and k in parameters:
             continue
-        if not remove and k not in parameterlist:
+        if not remove and k not in parameters:
             continue
         querylist.append(ksv)
         seen.add(k)
@@ -396,6 +409,11 @@ def add_or_replace_parameters(url: str, new_parameters: dict[str, str]) -> str:
     return _add_or_replace_parameters(url, new_parameters)
 
 
+# os.path.splitdrive() never finds a drive outside Windows, so resolve that
+# once here instead of on every any_to_uri() call.
+_PATHS_HAVE_DRIVES = os.name == "nt"
+
+
 def path_to_file_uri(path: str | os.PathLike[str]) -> str:
     """Convert local filesystem path to legal File URIs as described in:
     http://en.wikipedia.org/wiki/File_URI_scheme
@@ -416,7 +434,7 @@ def any_to_uri(uri_or_path: str) -> str:
     """If given a path name, return its File URI, otherwise return it
     unmodified
     """
-    if os.path.splitdrive(uri_or_path)[0]:
+    if _PATHS_HAVE_DRIVES and os.path.splitdrive(uri_or_path)[0]:
         return path_to_file_uri(uri_or_path)
     u = urlparse(uri_or_path)
     return uri_or_path if u.scheme else path_to_file_uri(uri_or_path)
@@ -550,10 +568,10 @@ def _safe_ParseResult(
     return (
         parts.scheme,
         netloc,
-        quote(parts.path.encode(path_encoding), _path_safe_chars),
-        quote(parts.params.encode(path_encoding), _safe_chars),
-        quote(parts.query.encode(encoding), _safe_chars),
-        quote(parts.fragment.encode(encoding), _safe_chars),
+        quote(parts.path.encode(path_encoding), _path_safe_chars_str),
+        quote(parts.params.encode(path_encoding), _safe_chars_str),
+        quote(parts.query.encode(encoding), _safe_chars_str),
+        quote(parts.fragment.encode(encoding), _safe_chars_str),
     )
 
 
@@ -595,13 +613,14 @@ def canonicalize_url(
     # if not for proper URL expected by remote website.
     if isinstance(url, str):
         url = _strip(url)
+    parsed_url = parse_url(url)
     try:
         scheme, netloc, path, params, query, fragment = _safe_ParseResult(
-            parse_url(url), encoding=encoding or "utf8"
+            parsed_url, encoding=encoding or "utf8"
         )
     except UnicodeEncodeError:
         scheme, netloc, path, params, query, fragment = _safe_ParseResult(
-            parse_url(url), encoding="utf8"
+            parsed_url, encoding="utf8"
         )
 
     # 1. decode query-string as UTF-8 (or keep raw bytes),
@@ -639,20 +658,23 @@ def canonicalize_url(
     # 2. decode percent-encoded sequences in path as UTF-8 (or keep raw bytes)
     #    and percent-encode path again (this normalizes to upper-case %XX)
     uqp = _unquotepath(path)
-    path = quote(uqp, _path_safe_chars) or "/"
+    path = quote(uqp, _path_safe_chars_str) or "/"
 
     fragment = "" if not keep_fragments else fragment
 
     # Apply lowercase to the domain, but not to the userinfo.
-    netloc_parts = netloc.split("@")
-    netloc_parts[-1] = netloc_parts[-1].lower().rstrip(":")
-    netloc = "@".join(netloc_parts)
+    userinfo, at, hostport = netloc.rpartition("@")
+    netloc = f"{userinfo}{at}{hostport.lower().rstrip(':')}"
 
     # every part should be safe already
     return urlunparse((scheme, netloc, path, params, query, fragment))
 
 
 def _unquotepath(path: str) -> bytes:
+    if "%" not in path:
+        # nothing to escape or unquote
+        return path.encode("utf-8")
+
     for reserved in ("2f", "2F", "3f", "3F"):
         path = path.replace("%" + reserved, "%25" + reserved.upper())
 